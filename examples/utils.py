@@ -13,13 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from transformers import AutoTokenizer, LlamaTokenizer, T5Tokenizer
-
 from tensorrt_llm.bindings import GptJsonConfig
-from tensorrt_llm.builder import get_engine_version
 
 DEFAULT_HF_MODEL_DIRS = {
     'BaichuanForCausalLM': 'baichuan-inc/Baichuan-13B-Chat',
@@ -55,24 +54,32 @@ DEFAULT_PROMPT_TEMPLATES = {
 }
 
 
+# The cached dict is shared by all callers; read from it, never mutate it.
+@lru_cache(maxsize=16)
+def _load_config(engine_dir):
+    with open(os.path.join(engine_dir, "config.json"), 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=16)
+def _load_gpt_json_config(engine_dir):
+    return GptJsonConfig.parse_file(os.path.join(engine_dir, "config.json"))
+
+
 def supports_inflight_batching(engine_dir):
-    config_path = Path(engine_dir) / "config.json"
-    json_config = GptJsonConfig.parse_file(config_path)
+    json_config = _load_gpt_json_config(os.path.realpath(engine_dir))
     model_config = json_config.model_config
     return model_config.supports_inflight_batching
 
 
 def read_decoder_start_token_id(engine_dir):
-    with open(Path(engine_dir) / "config.json", 'r') as f:
-        config = json.load(f)
+    config = _load_config(os.path.realpath(engine_dir))
     return config['pretrained_config']['decoder_start_token_id']
 
 
 def read_model_name(engine_dir: str):
-    engine_version = get_engine_version(engine_dir)
-
-    with open(Path(engine_dir) / "config.json", 'r') as f:
-        config = json.load(f)
+    config = _load_config(os.path.realpath(engine_dir))
+    engine_version = config.get('version')
 
     if engine_version is None:
         return config['builder_config']['name'], None
@@ -87,11 +94,15 @@ def read_model_name(engine_dir: str):
 
 
 def throttle_generator(generator, stream_interval):
-    for i, out in enumerate(generator):
-        if not i % stream_interval:
+    countdown = 1
+    out = sentinel = object()
+    for out in generator:
+        countdown -= 1
+        if countdown == 0:
             yield out
+            countdown = stream_interval
 
-    if i % stream_interval:
+    if out is not sentinel and countdown != stream_interval:
         yield out
 
 
@@ -101,6 +112,8 @@ def load_tokenizer(tokenizer_dir: Optional[str] = None,
                    model_version: Optional[str] = None,
                    tokenizer_type: Optional[str] = None):
     if vocab_file is None:
+        from transformers import AutoTokenizer
+
         use_fast = True
         if tokenizer_type is not None and tokenizer_type == "llama":
             use_fast = False
@@ -121,12 +134,16 @@ def load_tokenizer(tokenizer_dir: Optional[str] = None,
                                    truncation_side='left',
                                    legacy=False)
     elif model_name == 'Grok1ModelForCausalLM':
+        from transformers import LlamaTokenizer
+
         tokenizer = LlamaTokenizer(vocab_file=vocab_file,
                                    padding_side='left',
                                    truncation_side='left',
                                    legacy=False,
                                    use_fast=False)
     else:
+        from transformers import T5Tokenizer
+
         # For gpt-next, directly load from tokenizer.model
         tokenizer = T5Tokenizer(vocab_file=vocab_file,
                                 padding_side='left',